@@ -0,0 +1,2 @@
+'''Scaling benchmarks of the toolkit. Run them with python -m benchmarks run and check
+    two result files with python -m benchmarks compare.'''
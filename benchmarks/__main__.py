@@ -0,0 +1,57 @@
+import argparse
+import sys
+
+from benchmarks.cases import CASES
+from benchmarks.harness import run, save, load, compare
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmark the toolkit and detect performance regressions.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the scaling sweeps')
+    run_parser.add_argument('-o', '--output', default='bench_output.json',
+                            help='JSON file to write the results to')
+    run_parser.add_argument('-k', '--case', action='append',
+                            help='only run the cases whose name contains this text')
+    run_parser.add_argument('--quick', action='store_true',
+                            help='only run the two smallest sizes of each case')
+    run_parser.add_argument('--repeat', type=int, default=3,
+                            help='number of timing rounds')
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('old', help='reference results')
+    compare_parser.add_argument('new', help='results to check')
+    compare_parser.add_argument('-t', '--threshold', type=float, default=0.25,
+                                help='allowed relative growth, 0.25 means 25%%')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        cases = [c for c in CASES if not args.case or any(k in c.name for k in args.case)]
+        measurements = run(cases, args.quick, args.repeat)
+
+        for m in measurements:
+            line = f'{m.case:<24} {m.size:>8} {m.seconds:>12.3e}s {m.peak_bytes:>10}B'
+            if m.baseline is not None:
+                line += f'   {m.baseline}: {m.baseline_seconds:.3e}s (x{m.seconds / m.baseline_seconds:.1f})'
+            print(line)
+
+        save(measurements, args.output)
+        return 0
+
+    regressions = compare(load(args.old), load(args.new), args.threshold)
+
+    for r in regressions:
+        print(f'REGRESSION {r.case:<24} {r.size:>8} {r.metric:<10} {r.old:.3e} -> {r.new:.3e}')
+
+    if regressions:
+        return 1
+
+    print('No regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
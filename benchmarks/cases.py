@@ -0,0 +1,95 @@
+from typing import Callable, List, NamedTuple, Optional, Tuple
+from math import gcd
+import random
+
+from src.integer_arith import (mod_exponentiation, totient, fermat_primality, divp_factorization,
+                               sieve_of_eratosthenes, elegant_eea)
+from src.modular_arith import (RSAKey, RSAMessage, CongruenceEquation, CRT_solve_special_case,
+                               inverse_igneous, inverse_elegant_eea)
+from src.recursion import HomogenousRecursion, Case
+
+'''Every benchmark case maps an input size to the arguments of the function under test.
+    Cases with a baseline also time a stdlib function on the same arguments.'''
+
+BenchmarkCase = NamedTuple('BenchmarkCase', [('name', str),
+                                             ('func', Callable),
+                                             ('sizes', List[int]),
+                                             ('setup', Callable[[int], Tuple]),
+                                             ('baseline', Optional[Tuple[str, Callable]])])
+
+# Mersenne exponents of the RSA primes, by bit size of the modulus
+RSA_PRIMES = {150: (61, 89), 234: (107, 127), 1128: (521, 607)}
+
+# Largest prime below each modulus size
+INVERSE_PRIMES = {100: 97, 1000: 997, 10000: 9973, 100000: 99991}
+
+
+def _rng(size: int) -> random.Random:
+    return random.Random(size)
+
+
+def _odd_bits(size: int) -> int:
+    n = _rng(size).getrandbits(size) | (1 << (size-1)) | 1
+    while n % 3 == 0:
+        n += 2
+    return n
+
+
+def _modexp_args(size: int) -> Tuple[int, int, int]:
+    rng = _rng(size)
+    return (rng.getrandbits(size), rng.getrandbits(size), rng.getrandbits(size) | 1)
+
+
+def _eea_args(size: int) -> Tuple[int, int]:
+    rng = _rng(size)
+    return (rng.getrandbits(size), rng.getrandbits(size))
+
+
+def _inverse_args(size: int) -> Tuple[int, int]:
+    mod = INVERSE_PRIMES[size]
+    return (_rng(size).randrange(2, mod), mod)
+
+
+def _crt_args(size: int) -> Tuple[List[CongruenceEquation]]:
+    rng = _rng(size)
+    primes = sieve_of_eratosthenes(8*size)[:size]
+    return ([CongruenceEquation(1, rng.randrange(p), p) for p in primes],)
+
+
+def _rsa_args(size: int) -> Tuple[RSAMessage, RSAKey]:
+    p, q = [2**e - 1 for e in RSA_PRIMES[size]]
+    key = RSAKey(p, q, 65537)
+    return (RSAMessage(_rng(size).randrange(key.n)), key)
+
+
+def _recursion_args(size: int) -> Tuple[HomogenousRecursion, int]:
+    fibonacci = HomogenousRecursion((1, 1, 1), [Case(0, 0), Case(1, 1)])
+    return (fibonacci, size)
+
+
+CASES = [
+    BenchmarkCase('sieve_of_eratosthenes', sieve_of_eratosthenes,
+                  [250, 500, 1000, 2000], lambda size: (size,), None),
+    BenchmarkCase('divp_factorization', divp_factorization,
+                  [12, 16, 20, 24], lambda size: (_odd_bits(size),), None),
+    BenchmarkCase('fermat_primality', fermat_primality,
+                  [61, 127, 521, 607], lambda size: (2**size - 1,), None),
+    BenchmarkCase('totient', totient,
+                  [12, 16, 20, 24], lambda size: (_odd_bits(size),), None),
+    BenchmarkCase('mod_exponentiation', mod_exponentiation,
+                  [64, 256, 1024, 2048], _modexp_args, ('pow', pow)),
+    BenchmarkCase('elegant_eea', elegant_eea,
+                  [64, 256, 1024, 4096], _eea_args, ('math.gcd', gcd)),
+    BenchmarkCase('inverse_igneous', inverse_igneous,
+                  [100, 1000, 10000, 100000], _inverse_args, ('pow', lambda a, m: pow(a, -1, m))),
+    BenchmarkCase('inverse_elegant_eea', inverse_elegant_eea,
+                  [100, 1000, 10000, 100000], _inverse_args, ('pow', lambda a, m: pow(a, -1, m))),
+    BenchmarkCase('CRT_solve_special_case', CRT_solve_special_case,
+                  [2, 4, 8, 16], _crt_args, None),
+    BenchmarkCase('rsa_encrypt', lambda message, key: message.encrypt(key),
+                  [150, 234, 1128], _rsa_args, ('pow', lambda message, key: pow(message.message, key.exp, key.n))),
+    BenchmarkCase('rsa_private_key', lambda message, key: key.private_key(),
+                  [150, 234, 1128], _rsa_args, ('pow', lambda message, key: pow(key.exp, -1, key.totient))),
+    BenchmarkCase('recursion_solve_for_n', lambda recursion, n: recursion.solve_for_n(n),
+                  [10, 100, 500, 1000], _recursion_args, None),
+]
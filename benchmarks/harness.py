@@ -0,0 +1,159 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import json
+import platform
+import time
+import timeit
+import tracemalloc
+
+from benchmarks.cases import BenchmarkCase
+
+Measurement = NamedTuple('Measurement', [('case', str),
+                                         ('size', int),
+                                         ('seconds', float),
+                                         ('peak_bytes', int),
+                                         ('baseline', Optional[str]),
+                                         ('baseline_seconds', Optional[float])])
+
+# Growth below these absolute amounts is noise, whatever the relative threshold says
+FLOORS = {'seconds': 1e-6, 'peak_bytes': 1024}
+
+Regression = NamedTuple('Regression', [('case', str),
+                                       ('size', int),
+                                       ('metric', str),
+                                       ('old', float),
+                                       ('new', float)])
+
+# Measuring
+
+
+def time_call(func: Callable, args: Tuple, repeat: int = 3) -> float:
+    """
+    The time_call function returns the best time per call of func(*args), in seconds,
+    out of repeat rounds. Each round makes as many calls as timeit needs to last 0.2s.
+
+    :param func: Callable: The function to time
+    :param args: Tuple: The arguments of the call
+    :param repeat: int: Number of rounds
+    :return: The best time per call in seconds
+
+    """
+
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat, number)) / number
+
+
+def peak_memory(func: Callable, args: Tuple) -> int:
+    """
+    The peak_memory function returns the peak of memory allocated by Python during
+    one call of func(*args), in bytes.
+
+    :param func: Callable: The function to measure
+    :param args: Tuple: The arguments of the call
+    :return: The peak of allocated bytes
+
+    """
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def run(cases: List[BenchmarkCase], quick: bool = False, repeat: int = 3) -> List[Measurement]:
+    """
+    The run function sweeps every case over its sizes, measuring time and peak memory
+    and timing the baseline of the case when it has one.
+
+    :param cases: List[BenchmarkCase]: The cases to run
+    :param quick: bool: Only run the two smallest sizes of each case
+    :param repeat: int: Number of timing rounds
+    :return: A list of Measurement objects
+
+    """
+
+    measurements = list()
+
+    for case in cases:
+        sizes = case.sizes[:2] if quick else case.sizes
+
+        for size in sizes:
+            args = case.setup(size)
+            seconds = time_call(case.func, args, repeat)
+            peak = peak_memory(case.func, args)
+
+            baseline_name, baseline_seconds = None, None
+            if case.baseline is not None:
+                baseline_name, baseline = case.baseline
+                baseline_seconds = time_call(baseline, args, repeat)
+
+            measurements.append(Measurement(case.name, size, seconds, peak,
+                                            baseline_name, baseline_seconds))
+
+    return measurements
+
+# Results
+
+
+def save(measurements: List[Measurement], path: str) -> None:
+    """
+    The save function writes the measurements as JSON, along with the Python
+    version and platform they were taken on.
+
+    :param measurements: List[Measurement]: The measurements to write
+    :param path: str: The output file
+    :return: None
+
+    """
+
+    results = {
+        'meta': {'python': platform.python_version(),
+                 'platform': platform.platform(),
+                 'timestamp': time.time()},
+        'results': [m._asdict() for m in measurements],
+    }
+
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path: str) -> List[Measurement]:
+    with open(path) as f:
+        return [Measurement(**m) for m in json.load(f)['results']]
+
+
+def compare(old: List[Measurement], new: List[Measurement], threshold: float = 0.25,
+            floors: Optional[Dict[str, float]] = None) -> List[Regression]:
+    """
+    The compare function returns the regressions of new against old: every case and size
+    present in both whose time or peak memory grew by more than the threshold and by more
+    than the absolute floor of the metric.
+
+    :param old: List[Measurement]: The reference measurements
+    :param new: List[Measurement]: The measurements to check
+    :param threshold: float: Allowed relative growth, 0.25 means 25%
+    :param floors: Optional[Dict[str, float]]: Allowed absolute growth per metric, FLOORS by default
+    :return: A list of Regression objects
+
+    """
+
+    floors = FLOORS if floors is None else floors
+    reference: Dict[Tuple[str, int], Measurement] = {(m.case, m.size): m for m in old}
+    regressions = list()
+
+    for m in new:
+        ref = reference.get((m.case, m.size))
+        if ref is None:
+            continue
+
+        for metric in ('seconds', 'peak_bytes'):
+            before, after = getattr(ref, metric), getattr(m, metric)
+            if after > before * (1 + threshold) and after - before > floors.get(metric, 0):
+                regressions.append(Regression(m.case, m.size, metric, before, after))
+
+    return regressions
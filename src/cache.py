@@ -0,0 +1,289 @@
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from collections import OrderedDict
+from functools import wraps
+import inspect
+import pickle
+import sqlite3
+import threading
+
+'''Opt-in memoization for the toolkit. Every memoized function is registered under its
+    name and is cached only after enable() is called for it. Results are kept in an
+    in-process LRU bounded by entries and bytes and, if a path is configured, in a
+    sqlite file so that they survive restarts. A function only stores a result when
+    its cacheable rule says the result is deterministic. Keys include the version of
+    the function, which is bumped whenever its results change, so that results
+    persisted by an older version are not returned.'''
+
+CacheStats = NamedTuple('CacheStats', [('hits', int), ('misses', int), ('disk_hits', int),
+                                       ('size', int), ('bytes', int)])
+
+# LRU
+
+
+class LRUCache:
+    def __init__(self, maxsize: Optional[int] = 1024, maxbytes: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def get(self, key: str) -> Any:
+        """
+        The get function returns the value stored under key and marks it as the most
+        recently used one. It raises KeyError if key is not stored.
+
+        :param key: str: The key of the entry
+        :return: The stored value
+
+        """
+
+        value, _ = self.entries[key]
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        """
+        The put function stores value under key and evicts the least recently used
+        entries until both the entry and the byte caps are respected.
+
+        :param key: str: The key of the entry
+        :param value: Any: The value to store
+        :param size: int: The size of the value in bytes
+        :return: None
+
+        """
+
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+
+        self.entries[key] = (value, size)
+        self.bytes += size
+
+        while ((self.maxsize is not None and len(self.entries) > self.maxsize) or
+               (self.maxbytes is not None and self.bytes > self.maxbytes)):
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= evicted
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+# Disk
+
+
+class DiskStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # One connection shared by every thread, serialized by the lock
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)')
+
+    def __len__(self) -> int:
+        return self.execute('SELECT COUNT(*) FROM cache')[0]
+
+    def execute(self, sql: str, parameters: tuple = ()) -> Optional[tuple]:
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchone()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        The get function returns the pickled value stored under key, or None.
+
+        :param key: str: The key of the entry
+        :return: The pickled value or None
+
+        """
+
+        row = self.execute('SELECT value FROM cache WHERE key = ?', (key,))
+        return row[0] if row is not None else None
+
+    def put(self, key: str, value: bytes) -> None:
+        self.execute('INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)', (key, value))
+
+    def clear(self) -> None:
+        self.execute('DELETE FROM cache')
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+# Registry
+
+
+_lru = LRUCache()
+_disk = None
+_enabled = set()
+_registry = dict()
+_stats = dict()
+
+
+def configure(maxsize: Optional[int] = 1024, maxbytes: Optional[int] = None,
+              path: Optional[str] = None) -> None:
+    """
+    The configure function replaces the cache storage. Cached results are discarded,
+    except those already written to the sqlite file at path.
+
+    :param maxsize: Optional[int]: Maximum number of entries in memory, None for no cap
+    :param maxbytes: Optional[int]: Maximum pickled bytes in memory, None for no cap
+    :param path: Optional[str]: A sqlite file to persist results, None to keep them in memory only
+    :return: None
+
+    """
+
+    global _lru, _disk
+
+    if _disk is not None:
+        _disk.close()
+
+    _lru = LRUCache(maxsize, maxbytes)
+    _disk = DiskStore(path) if path is not None else None
+
+    for name in _stats:
+        _stats[name] = [0, 0, 0]
+
+
+def enable(*names: str) -> None:
+    """
+    The enable function turns caching on for the given functions, or for every
+    memoized function if no name is given.
+
+    :param names: str: Names of memoized functions
+    :return: None
+
+    """
+
+    for name in names or _registry:
+        if name not in _registry:
+            raise ValueError(f'{name} is not a memoized function')
+        _enabled.add(name)
+
+
+def disable(*names: str) -> None:
+    """
+    The disable function turns caching off for the given functions, or for every
+    memoized function if no name is given. Stored results are kept.
+
+    :param names: str: Names of memoized functions
+    :return: None
+
+    """
+
+    for name in names or list(_enabled):
+        _enabled.discard(name)
+
+
+def is_enabled(name: str) -> bool:
+    return name in _enabled
+
+
+def clear() -> None:
+    """
+    The clear function removes every stored result, both in memory and on disk,
+    and resets the statistics.
+
+    :return: None
+
+    """
+
+    _lru.clear()
+    if _disk is not None:
+        _disk.clear()
+
+    for name in _stats:
+        _stats[name] = [0, 0, 0]
+
+
+def stats(name: Optional[str] = None) -> CacheStats:
+    """
+    The stats function returns the hit and miss counters of a memoized function,
+    or the totals if no name is given, along with the size of the in-memory cache.
+
+    :param name: Optional[str]: Name of a memoized function
+    :return: A CacheStats object
+
+    """
+
+    counters = [_stats[name]] if name is not None else list(_stats.values())
+
+    hits = sum(c[0] for c in counters)
+    misses = sum(c[1] for c in counters)
+    disk_hits = sum(c[2] for c in counters)
+
+    return CacheStats(hits, misses, disk_hits, len(_lru), _lru.bytes)
+
+# Decorator
+
+
+def memoize(cacheable: Optional[Callable[[Dict[str, Any], Any], bool]] = None,
+            encode: Optional[Callable[[Any], Any]] = None,
+            decode: Optional[Callable[[Any], Any]] = None, version: int = 1) -> Callable:
+    """
+    The memoize function returns a decorator that registers a function in the cache.
+    The function is called as usual until caching is enabled for it.
+
+    :param cacheable: Callable: Receives the arguments bound to their parameter names,
+        defaults included, and the result, and returns True if the result is deterministic
+        and may be stored. By default every result is stored.
+    :param encode: Callable: Turns a result into a picklable value before storing it
+    :param decode: Callable: Turns a stored value back into a result
+    :param version: int: Part of every key, to bump whenever the results of the function change
+    :return: The decorator
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        _registry[name] = func
+        _stats[name] = [0, 0, 0]
+        signature = inspect.signature(func)
+        prefix = f'{name}@v{version}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if name not in _enabled:
+                return func(*args, **kwargs)
+
+            counters = _stats[name]
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = prefix + repr(tuple(bound.arguments.items()))
+
+            if key in _lru:
+                counters[0] += 1
+                stored = _lru.get(key)
+                return decode(stored) if decode else stored
+
+            if _disk is not None:
+                blob = _disk.get(key)
+                if blob is not None:
+                    counters[0] += 1
+                    counters[2] += 1
+                    stored = pickle.loads(blob)
+                    _lru.put(key, stored, len(blob))
+                    return decode(stored) if decode else stored
+
+            counters[1] += 1
+            result = func(*args, **kwargs)
+
+            if cacheable is None or cacheable(bound.arguments, result):
+                stored = encode(result) if encode else result
+                blob = pickle.dumps(stored)
+                _lru.put(key, stored, len(blob))
+                if _disk is not None:
+                    _disk.put(key, blob)
+
+            return result
+
+        return wrapper
+
+    return decorator
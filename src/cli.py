@@ -0,0 +1,275 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import argparse
+import fileinput
+import json
+import os
+import signal
+import sys
+import time
+
+from src.integer_arith import divp_factorization, fermat_primality, totient
+from src.modular_arith import (CongruenceEquation, CRT_solve_special_case, inverse_elegant_eea,
+                               normalize_equation)
+from src.recursion import HomogenousRecursion, Case
+
+'''Command line entry point: python -m src OPERATION [FILE ...]. Every non blank input line
+    is an item, and every item gets one JSON line in the output, in input order. Items are
+    sent to a process pool in chunks, with a bounded number of chunks in flight.
+
+    Line formats:
+        factor, is_prime, totient:   n
+        inverse:                     a mod
+        crt:                         r1 m1; r2 m2; ...   or   a1 r1 m1; a2 r2 m2; ...
+        term:                        n, with the recurrence given by --coefficients and --cases'''
+
+# Operations
+
+
+def _ints(line: str) -> List[int]:
+    return [int(x) for x in line.split()]
+
+
+def _single(line: str) -> int:
+    values = _ints(line)
+    if len(values) != 1:
+        raise ValueError('Expected one integer')
+    return values[0]
+
+
+def _positive(line: str) -> int:
+    n = _single(line)
+    if n < 1:
+        raise ValueError('n must be positive')
+    return n
+
+
+def _factor(line: str, options: Dict[str, Any]) -> List[List[int]]:
+    return [[p, e] for p, e in divp_factorization(_positive(line))]
+
+
+def _is_prime(line: str, options: Dict[str, Any]) -> bool:
+    return fermat_primality(_single(line), options['confidence'])
+
+
+def _totient(line: str, options: Dict[str, Any]) -> int:
+    return totient(_positive(line))
+
+
+def _inverse(line: str, options: Dict[str, Any]) -> int:
+    values = _ints(line)
+    if len(values) != 2:
+        raise ValueError('Expected a and mod')
+    return inverse_elegant_eea(*values)
+
+
+def _crt(line: str, options: Dict[str, Any]) -> Dict[str, int]:
+    equations = list()
+
+    for part in line.split(';'):
+        values = _ints(part)
+        if len(values) == 2:
+            values = [1] + values
+        if len(values) != 3:
+            raise ValueError('Expected r mod or a r mod for each congruence')
+        equations.append(normalize_equation(CongruenceEquation(*values)))
+
+    solution = CRT_solve_special_case(equations)
+    return {'mod': solution.coefficient_k, 'remainder': solution.remainder}
+
+
+def _term(line: str, options: Dict[str, Any]) -> float:
+    if options['coefficients'] is None or options['cases'] is None:
+        raise ValueError('term needs --coefficients and --cases')
+
+    recursion = HomogenousRecursion(tuple(options['coefficients']),
+                                    [Case(*c) for c in options['cases']])
+    return recursion.solve_for_n(_single(line))
+
+
+OPERATIONS: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {
+    'factor': _factor,
+    'is_prime': _is_prime,
+    'totient': _totient,
+    'inverse': _inverse,
+    'crt': _crt,
+    'term': _term,
+}
+
+# Workers
+
+
+class ItemTimeout(Exception):
+    pass
+
+
+def _alarm(signum, frame):
+    raise ItemTimeout()
+
+
+def run_chunk(operation: str, options: Dict[str, Any], lines: List[str]) -> List[Dict[str, Any]]:
+    """
+    The run_chunk function applies an operation to every line of a chunk. Errors and
+    timeouts are reported in the output of their item instead of being raised.
+    Timeouts need SIGALRM, so they are ignored on platforms without it.
+
+    :param operation: str: Name of the operation
+    :param options: Dict[str, Any]: The options of the operation, with the timeout in seconds
+    :param lines: List[str]: The input lines
+    :return: A list of dicts with the input and either its result or its error
+
+    """
+
+    func = OPERATIONS[operation]
+    timeout = options.get('timeout')
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+    outputs = list()
+
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _alarm)
+
+    try:
+        for line in lines:
+            output = {'input': line}
+            try:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                try:
+                    output['result'] = func(line, options)
+                finally:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except ItemTimeout:
+                output['error'] = 'timeout'
+            except Exception as e:
+                output['error'] = str(e) or type(e).__name__
+            outputs.append(output)
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous)
+
+    return outputs
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process(operation: str, options: Dict[str, Any], lines: Iterable[str], jobs: int = 1,
+            chunksize: int = 64, max_chunks: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    The process function streams the lines through an operation and yields the outputs
+    in input order. With more than one job the chunks are run by a process pool, and
+    at most max_chunks of them are in flight, which bounds the memory used.
+
+    :param operation: str: Name of the operation
+    :param options: Dict[str, Any]: The options of the operation
+    :param lines: Iterable[str]: The input lines
+    :param jobs: int: Number of worker processes, 1 to run in this process
+    :param chunksize: int: Number of lines per chunk
+    :param max_chunks: Optional[int]: Chunks in flight, 2*jobs by default
+    :return: An iterator over the outputs
+
+    """
+
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive')
+
+    chunks = _chunks(lines, chunksize)
+
+    if jobs <= 1:
+        for chunk in chunks:
+            yield from run_chunk(operation, options, chunk)
+        return
+
+    max_chunks = max_chunks or 2*jobs
+
+    with ProcessPoolExecutor(jobs) as pool:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(pool.submit(run_chunk, operation, options, chunk))
+            if len(pending) >= max_chunks:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+# Command Line
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f'{text} is not a positive integer')
+    return value
+
+
+def _case(text: str) -> Case:
+    index, value = text.split(':')
+    return Case(int(index), int(value))
+
+
+def _read(files: List[str]) -> Iterator[str]:
+    with fileinput.input(files or ('-',)) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m src',
+                                     description='Stream integers through the toolkit operations.')
+    parser.add_argument('operation', choices=sorted(OPERATIONS))
+    parser.add_argument('files', nargs='*', help='input files, stdin if none or -')
+    parser.add_argument('-o', '--output', help='output file, stdout by default')
+    parser.add_argument('-j', '--jobs', type=_positive_int, default=os.cpu_count() or 1,
+                        help='worker processes, 1 to run in this process')
+    parser.add_argument('--chunksize', type=_positive_int, default=64, help='lines per chunk')
+    parser.add_argument('--max-chunks', type=_positive_int, help='chunks in flight, 2*jobs by default')
+    parser.add_argument('--timeout', type=float, help='seconds allowed per item')
+    parser.add_argument('--confidence', type=int, default=100, help='rounds of the Fermat test')
+    parser.add_argument('--coefficients', type=int, nargs='+',
+                        help='coefficients A B [C] of the recurrence Aa(n) = Ba(n-1) + Ca(n-2)')
+    parser.add_argument('--cases', type=_case, nargs='+', help='initial cases as index:value')
+    parser.add_argument('-q', '--quiet', action='store_true', help="don't print throughput stats")
+
+    args = parser.parse_args(argv)
+    options = {'timeout': args.timeout,
+               'confidence': args.confidence,
+               'coefficients': args.coefficients,
+               'cases': args.cases}
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    items = errors = timeouts = 0
+    start = time.perf_counter()
+
+    try:
+        for output in process(args.operation, options, _read(args.files),
+                              args.jobs, args.chunksize, args.max_chunks):
+            out.write(json.dumps(output) + '\n')
+
+            items += 1
+            if 'error' in output:
+                errors += 1
+                timeouts += output['error'] == 'timeout'
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rate = items / elapsed if elapsed > 0 else 0.0
+        print(f'{items} items ({errors} errors, {timeouts} timeouts) in {elapsed:.3f}s: '
+              f'{rate:.1f} items/s', file=sys.stderr)
+
+    return 0
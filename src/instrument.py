@@ -0,0 +1,205 @@
+from typing import Any, Callable, Dict, Iterator
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+import json
+import sys
+
+'''Lightweight instrumentation of the toolkit primitives. The instrumented decorator leaves
+    functions untouched and only prepares a recording wrapper: enable() rebinds the attributes
+    that refer to an instrumented function to its wrapper in the modules of the toolkit package,
+    and disable() restores them. While disabled the primitives run as plain functions; all that
+    remains of their loop counters is a local count and one check of the enabled flag per call.
+    Calls through references held outside the toolkit, such as names imported by other packages
+    or taken before enable(), are not recorded, and neither are modules imported after enable().
+
+    While enabled, every call records its count, its cumulative time (inclusive of nested
+    instrumented calls) and the bit size of its largest int argument, and the primitives add
+    their loop counters, such as the rounds of fermat_primality or the trial divisions of
+    divp_algorithm.'''
+
+enabled = False
+
+# id of each instrumented function -> (function, wrapper)
+_wrappers = dict()
+# Top level packages of the instrumented functions, whose modules enable() patches
+_packages = set()
+# (module namespace, attribute, function) rebound by enable()
+_patches = list()
+
+# Recorder
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.calls = defaultdict(int)
+        self.seconds = defaultdict(float)
+        self.bits = defaultdict(lambda: defaultdict(int))
+        self.counters = defaultdict(int)
+
+    def record(self, name: str, args: tuple, kwargs: Dict[str, Any], seconds: float) -> None:
+        self.calls[name] += 1
+        self.seconds[name] += seconds
+
+        sizes = [a.bit_length() for a in (*args, *kwargs.values()) if isinstance(a, int)]
+        if sizes:
+            self.bits[name][max(sizes)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        The snapshot function returns the collected data as plain dicts.
+
+        :return: A dict with a 'functions' entry holding the calls, seconds and bit size
+            histogram of every function, and a 'counters' entry with the loop counters
+
+        """
+
+        return {
+            'functions': {name: {'calls': self.calls[name],
+                                 'seconds': self.seconds[name],
+                                 'bits': dict(sorted(self.bits[name].items()))}
+                          for name in self.calls},
+            'counters': dict(self.counters),
+        }
+
+
+_recorder = Recorder()
+
+
+def enable() -> None:
+    """
+    The enable function starts the collection, rebinding the instrumented functions
+    to their wrappers in the loaded modules of the toolkit package.
+
+    :return: None
+
+    """
+
+    global enabled
+
+    if enabled:
+        return
+    enabled = True
+
+    for name, module in list(sys.modules.items()):
+        if name.split('.', 1)[0] not in _packages:
+            continue
+
+        namespace = getattr(module, '__dict__', None)
+        if not isinstance(namespace, dict):
+            continue
+
+        for attr, value in list(namespace.items()):
+            entry = _wrappers.get(id(value))
+            if entry is not None and entry[0] is value:
+                namespace[attr] = entry[1]
+                _patches.append((namespace, attr, value))
+
+
+def disable() -> None:
+    """
+    The disable function stops the collection and restores the plain functions.
+
+    :return: None
+
+    """
+
+    global enabled
+
+    while _patches:
+        namespace, attr, func = _patches.pop()
+        if namespace.get(attr) is _wrappers[id(func)][1]:
+            namespace[attr] = func
+
+    enabled = False
+
+
+def reset() -> None:
+    """
+    The reset function discards everything collected so far.
+
+    :return: None
+
+    """
+
+    global _recorder
+    _recorder = Recorder()
+
+
+def count(counter: str, amount: int = 1) -> None:
+    """
+    The count function adds amount to a loop counter. Callers check the enabled
+    flag first, so that disabled instrumentation doesn't pay for the call.
+
+    :param counter: str: Name of the counter, as function.counter
+    :param amount: int: The amount to add
+    :return: None
+
+    """
+
+    _recorder.counters[counter] += amount
+
+
+def snapshot() -> Dict[str, Any]:
+    return _recorder.snapshot()
+
+
+def to_json() -> str:
+    return json.dumps(snapshot(), indent=2)
+
+
+@contextmanager
+def collect() -> Iterator[Recorder]:
+    """
+    The collect function is a context manager that enables instrumentation for the
+    block with a fresh Recorder, and then restores the previous state.
+
+        with collect() as recorder:
+            totient(972)
+        recorder.snapshot()
+
+    :return: The Recorder of the block
+
+    """
+
+    global _recorder
+
+    previous, was_enabled = _recorder, enabled
+    _recorder = Recorder()
+    enable()
+
+    try:
+        yield _recorder
+    finally:
+        if not was_enabled:
+            disable()
+        _recorder = previous
+
+# Decorator
+
+
+def instrumented(func: Callable) -> Callable:
+    """
+    The instrumented function is a decorator that registers the recording wrapper
+    of func, which enable() installs. func itself is returned unchanged.
+
+    :param func: Callable: The function to instrument
+    :return: func
+
+    """
+
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = _recorder
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.record(name, args, kwargs, perf_counter() - start)
+
+    _wrappers[id(func)] = (func, wrapper)
+    _packages.add(func.__module__.split('.', 1)[0])
+    return func
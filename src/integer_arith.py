@@ -1,6 +1,12 @@
-from typing import DefaultDict, NamedTuple, Tuple, List
-from math import sqrt, floor
+from typing import DefaultDict, NamedTuple, Optional, Tuple, List, TYPE_CHECKING
+from math import sqrt, floor, isqrt
 import random
+from src.cache import memoize
+from src import instrument
+from src.instrument import instrumented
+
+if TYPE_CHECKING:
+    from src.modular_ring import ModRing
 
 EuclideanDivision = NamedTuple('EuclideanDivision', [(
     'dividend', int), ('divisor', int), ('quotient', int), ('remainder', int)])
@@ -11,19 +17,27 @@ EuclideanExtended = NamedTuple(
 # Basic
 
 
-def mod_exponentiation(b: int, e: int, n: int) -> int:
+@instrumented
+def mod_exponentiation(b: int, e: int, n: int, ring: Optional['ModRing'] = None) -> int:
     """
     The mod_exponentiation function takes in three integers, b, e and n.
-    It returns the result of b^e (mod n).
+    It returns the result of b^e (mod n). If a ModRing for n is given, the
+    power is computed by the ring, which uses the built-in pow.
 
 
     :param b: int: Represent the base of the modular power
     :param e: int: Specify the exponent
     :param n: int: Specify the modulus
+    :param ring: Optional[ModRing]: A ModRing whose modulus is n
     :return: The result of b^e mod n
 
     """
 
+    if ring is not None:
+        if ring.n != n:
+            raise ValueError('ring modulus must be n')
+        return ring.exp(b, e)
+
     res = 1
     exp_bin = bin(e)[2:]
     ins = [exp_bin[0]]
@@ -38,9 +52,14 @@ def mod_exponentiation(b: int, e: int, n: int) -> int:
         elif char == 'C':
             res = (res**2) % n
 
+    if instrument.enabled:
+        instrument.count('mod_exponentiation.squarings', len(exp_bin) - 1)
+
     return res
 
 
+@instrumented
+@memoize(cacheable=lambda args, res: res != args['n'] - 1, version=2)
 def totient(n: int) -> int:
     """
     The totient function, also known as Euler's totient function,
@@ -60,14 +79,16 @@ def totient(n: int) -> int:
         res = n
 
         for key, _ in primes:
-            res = res * (1-1/key)
+            res = res // key * (key-1)
 
-        return int(res)
+        return res
 
 
 # Primality Tests
 
 
+@instrumented
+@memoize(cacheable=lambda args, res: res is False)
 def fermat_primality(n: int, confidence: int = 100) -> bool:
     """
     The fermat_primality function takes in a number n and a confidence level, 
@@ -81,15 +102,25 @@ def fermat_primality(n: int, confidence: int = 100) -> bool:
 
     """
 
-    for _ in range(confidence):
+    if n < 4:
+        return n in (2, 3)
+
+    for i in range(confidence):
         b = random.randint(2, n-1)
         if mod_exponentiation(b, n, n) != b % n:
+            if instrument.enabled:
+                instrument.count('fermat_primality.rounds', i + 1)
             return False
+
+    if instrument.enabled:
+        instrument.count('fermat_primality.rounds', confidence)
     return True
 
 # Factorization
 
 
+@instrumented
+@memoize(encode=list, decode=lambda res: dict(res).items(), version=2)
 def divp_factorization(n: int) -> List[Tuple[int, int]]:
     """
     The divp_factorization function takes a positive integer n and returns the prime factorization of n.
@@ -168,13 +199,14 @@ def sieve_of_eratosthenes(n: int) -> List[int]:
     return primes
 
 
+@instrumented
 def divp_algorithm(n: int) -> int:
     """
     The divp_algorithm function takes a positive integer n as input and returns the smallest prime divisor of n.
         If n is prime, then it returns itself.
 
         The algorithm works by first checking if 2 or 3 are divisors of the number, since these are the only even primes. 
-        Then it checks all odd numbers up to sqrt(n) for primality using modular arithmetic.
+        Then it tries the candidates 6k-1 and 6k+1 up to sqrt(n), since every other prime has that form.
 
     :param n: int: Specify that the function takes an integer as input
     :return: The smallest prime divisor of n
@@ -183,19 +215,25 @@ def divp_algorithm(n: int) -> int:
 
     if n > 0:
         if n % 2 == 0:
-            return 2
+            res, divisions = 2, 1
         elif n % 3 == 0:
-            return 3
-
-        m = floor(sqrt(n)-1//6)
-
-        for k in range(1, m+1):
-            if (6*k-1) % n == 0:
-                return 6*k-1
-            elif (6*k+1) % n == 0:
-                return 6*k-1
-            elif k == m:
-                return n
+            res, divisions = 3, 2
+        else:
+            # Candidates 6k-1 and 6k+1 up to sqrt(n)
+            m = (isqrt(n)+1)//6
+            res, divisions = n, 2 + 2*m
+
+            for k in range(1, m+1):
+                if n % (6*k-1) == 0:
+                    res, divisions = 6*k-1, 2*k + 1
+                    break
+                if n % (6*k+1) == 0:
+                    res, divisions = 6*k+1, 2*k + 2
+                    break
+
+        if instrument.enabled:
+            instrument.count('divp_algorithm.trial_divisions', divisions)
+        return res
 
     else:
         raise ValueError('n must be positive')
@@ -237,6 +275,7 @@ def euclidean_algorithm(a: int, b: int) -> List[EuclideanDivision]:
         return operations
 
 
+@instrumented
 def elegant_eea(a: int, b: int) -> EuclideanExtended:
     """
     The elegant_eea function is an elegant implementation of the extended Euclidean algorithm.
@@ -252,11 +291,17 @@ def elegant_eea(a: int, b: int) -> EuclideanExtended:
     s, old_s = 0, 1
     t, old_t = 1, 0
 
+    steps = 0
+
     while r > 0:
-        c = int(floor(old_r/r))
+        c = old_r // r
+        steps += 1
 
         old_r, r = r, old_r - c*r
         old_s, s = s, old_s - c*s
         old_t, t = t, old_t - c*t
 
+    if instrument.enabled:
+        instrument.count('elegant_eea.steps', steps)
+
     return EuclideanExtended(old_r, old_s, old_t)
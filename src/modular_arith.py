@@ -1,5 +1,8 @@
-from typing import NamedTuple, List
+from typing import NamedTuple, List, Optional
 from src.integer_arith import mod_exponentiation, fermat_primality, elegant_eea
+from src.modular_ring import ModRing
+from src import instrument
+from src.instrument import instrumented
 from math import gcd
 
 CongruenceEquation = NamedTuple('CongruenceEquation', [(
@@ -12,12 +15,13 @@ CRTSolution = NamedTuple(
 
 
 class RSAKey:
-    def __init__(self, p: int, q: int, exp: int) -> None:
+    def __init__(self, p: int, q: int, exp: int, use_ring: bool = False) -> None:
         self.p = p
         self.q = q
         self.n = self.p*self.q
         self.exp = exp
         self.totient = (p-1)*(q-1)
+        self.ring = ModRing(self.n) if use_ring else None
 
     def check(self):
         """
@@ -66,9 +70,10 @@ class RSAMessage:
 
         return mod_exponentiation(self.message,
                                   public_key_addressee.exp,
-                                  public_key_addressee.n)
+                                  public_key_addressee.n,
+                                  public_key_addressee.ring)
 
-    def decrypt(self, private_key_receiver: int, n_receiver: int):
+    def decrypt(self, private_key_receiver: int, n_receiver: int, ring: Optional[ModRing] = None):
         """
         The decrypt function takes in the private key of the receiver and 
         the n value of the receiver. It then uses mod_exponentiation to decrypt 
@@ -76,17 +81,20 @@ class RSAMessage:
 
         :param private_key_receiver: int: The private key of the receiver
         :param n_receiver: int: The n of the receiver
+        :param ring: Optional[ModRing]: A ModRing for n_receiver, created once by the caller
         :return: The message decrypted, which is the result of mod_exponentiation
 
         """
 
         return mod_exponentiation(self.message,
                                   private_key_receiver,
-                                  n_receiver)
+                                  n_receiver,
+                                  ring)
 
 # Inverse
 
 
+@instrumented
 def inverse_igneous(n: int, mod: int) -> int:
     """
     The inverse_igneous function takes two integers, n and m, as input. It then returns the inverse of n module m.
@@ -107,9 +115,13 @@ def inverse_igneous(n: int, mod: int) -> int:
         remainder = (n*x) % mod
         x = x+1
 
+    if instrument.enabled:
+        instrument.count('inverse_igneous.candidates', x)
+
     return x-1
 
 
+@instrumented
 def inverse_elegant_eea(a: int, mod: int) -> int:
     """
     The inverse_elegant_eea function takes two integers a and n as input,
@@ -138,7 +150,7 @@ def normalize_equation(equation: CongruenceEquation) -> CongruenceEquation:
     The normalize_equation function takes in a congruence equation and returns the normalized form of that equation.
     The normalization process is as follows:
         1) Check if the gcd(coefficient_x, mod) == 1. If not, raise an error because we cannot find an inverse for coefficient_x in Zn.
-        2) Find the inverse of coefficient_x using our custom function 'inverse_igneous'. This will be used to multiply both sides by it's multiplicative inverse (modulo n).
+        2) Find the inverse of coefficient_x using 'inverse_elegant_eea'. This will be used to multiply both sides by it's multiplicative inverse (modulo n).
         3) Return a new CongruenceEquation object with x = 1 and remainder = (
 
     :param coefficient_x:int: Store the coefficient of x in the congruence equation
@@ -147,37 +159,51 @@ def normalize_equation(equation: CongruenceEquation) -> CongruenceEquation:
     :return: A congruence equation object, which is a tuple of three integers
     """
 
+    if equation.mod < 1:
+        raise ValueError('mod must be positive')
+
+    if equation.mod == 1:
+        return CongruenceEquation(1, 0, 1)
+
     if gcd(equation.coefficient_x, equation.mod) == 1:
 
-        INV = inverse_igneous(equation.coefficient_x, equation.mod)
+        INV = inverse_elegant_eea(equation.coefficient_x % equation.mod, equation.mod)
 
         return CongruenceEquation(1, (equation.remainder*INV) % equation.mod, equation.mod)
     else:
         raise ValueError('Inverse of the x coefficient in Zn does not exist')
 
 
-def CRT_solve_special_case(equations: List[CongruenceEquation]) -> CRTSolution:
+@instrumented
+def CRT_solve_special_case(equations: List[CongruenceEquation], ring: Optional[ModRing] = None) -> CRTSolution:
     """
     The CRT_solve_special_case function takes a list of congruence equations and returns the solution to the system.
         The function first finds N, which is equal to all of the moduli multiplied together. Then it uses this value 
         along with each equation's remainder and modulus in order to find x_0, which is then returned as part of a CRTSolution object.
 
     :param equations: List[CongruenceEquation]: Store the list of congruence equations
+    :param ring: Optional[ModRing]: A ModRing for N, created once by the caller, that keeps the sum reduced
     :return: A CRTSolution object
     """
 
     N = 1
-    rem = 0
 
     for eq in equations:
         N = N * eq.mod
 
+    if ring is None:
+        rem = 0
+    elif ring.n == N:
+        rem = ring(0)
+    else:
+        raise ValueError('ring modulus must be the product of the moduli')
+
     for eq in equations:
 
         b = eq.remainder
         c = N//eq.mod
-        d = inverse_igneous(c, eq.mod)
+        d = inverse_elegant_eea(c, eq.mod)
 
         rem += b*c*d
 
-    return CRTSolution(N, rem % N)
+    return CRTSolution(N, int(rem) % N)
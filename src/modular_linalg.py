@@ -0,0 +1,442 @@
+from typing import NamedTuple, List, Optional, Tuple
+from math import gcd
+from src.integer_arith import elegant_eea
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+'''Matrices are given as lists of rows of ints. Row reduction, rank, determinant,
+    inverse and kernel are computed over Z/pZ; hermite_normal_form, smith_normal_form
+    and solve_linear_system also work for composite moduli. When NumPy is available,
+    moduli below NUMPY_MAX_MOD are row reduced with int64 arrays, since every product
+    of two reduced entries then fits in a word.'''
+
+Matrix = List[List[int]]
+
+NUMPY_MAX_MOD = 2**31
+
+LinearSolution = NamedTuple('LinearSolution', [('particular', List[int]),
+                                               ('kernel', Matrix),
+                                               ('mod', int)])
+
+RowReduction = NamedTuple('RowReduction', [('matrix', Matrix),
+                                           ('pivots', List[int]),
+                                           ('determinant', int)])
+
+# Row Reduction
+
+
+def _inverse(a: int, n: int) -> int:
+    aee = elegant_eea(a, n)
+    if aee.d == 1:
+        return aee.alpha % n
+    raise ValueError("The inverse of a in Zn doesn't exist")
+
+
+def _row_reduce_python(M: Matrix, n: int) -> RowReduction:
+    rows, cols = len(M), len(M[0])
+    pivots = list()
+    det = 1
+    r = 0
+
+    for c in range(cols):
+        if r == rows:
+            break
+
+        pivot = next((i for i in range(r, rows) if M[i][c]), None)
+        if pivot is None:
+            continue
+
+        if pivot != r:
+            M[r], M[pivot] = M[pivot], M[r]
+            det = -det
+
+        a = M[r][c]
+        inv = _inverse(a, n)
+        det = det*a % n
+
+        M[r] = [x*inv % n for x in M[r]]
+        pivot_row = M[r]
+
+        for i in range(rows):
+            f = M[i][c]
+            if i != r and f:
+                M[i] = [(x - f*y) % n for x, y in zip(M[i], pivot_row)]
+
+        pivots.append(c)
+        r += 1
+
+    return RowReduction(M, pivots, det % n)
+
+
+def _row_reduce_numpy(M: Matrix, n: int) -> RowReduction:
+    A = np.array(M, dtype=np.int64)
+    rows, cols = A.shape
+    pivots = list()
+    det = 1
+    r = 0
+
+    for c in range(cols):
+        if r == rows:
+            break
+
+        nonzero = np.flatnonzero(A[r:, c])
+        if nonzero.size == 0:
+            continue
+
+        pivot = r + int(nonzero[0])
+        if pivot != r:
+            A[[r, pivot]] = A[[pivot, r]]
+            det = -det
+
+        a = int(A[r, c])
+        inv = _inverse(a, n)
+        det = det*a % n
+
+        A[r] = A[r]*inv % n
+        factors = A[:, c].copy()
+        factors[r] = 0
+        A = (A - np.outer(factors, A[r])) % n
+
+        pivots.append(c)
+        r += 1
+
+    return RowReduction(A.tolist(), pivots, det % n)
+
+
+def _row_reduce(matrix: Matrix, n: int) -> RowReduction:
+    M = [[x % n for x in row] for row in matrix]
+
+    if not M or not M[0]:
+        return RowReduction(M, [], 1 % n)
+
+    if np is not None and n < NUMPY_MAX_MOD:
+        return _row_reduce_numpy(M, n)
+    return _row_reduce_python(M, n)
+
+
+def row_reduce(matrix: Matrix, p: int) -> Matrix:
+    """
+    The row_reduce function takes a matrix and a prime p and returns the reduced
+    row echelon form of the matrix over Z/pZ.
+
+    :param matrix: Matrix: The matrix as a list of rows
+    :param p: int: Specify the prime modulus
+    :return: The reduced row echelon form of the matrix
+
+    """
+
+    return _row_reduce(matrix, p).matrix
+
+
+def rank(matrix: Matrix, p: int) -> int:
+    """
+    The rank function returns the rank of a matrix over Z/pZ.
+
+    :param matrix: Matrix: The matrix as a list of rows
+    :param p: int: Specify the prime modulus
+    :return: The rank of the matrix
+
+    """
+
+    return len(_row_reduce(matrix, p).pivots)
+
+
+def determinant(matrix: Matrix, p: int) -> int:
+    """
+    The determinant function returns the determinant of a square matrix over Z/pZ.
+
+    :param matrix: Matrix: The square matrix as a list of rows
+    :param p: int: Specify the prime modulus
+    :return: The determinant of the matrix, in [0, p)
+
+    """
+
+    if any(len(row) != len(matrix) for row in matrix):
+        raise ValueError('The matrix must be square')
+
+    reduction = _row_reduce(matrix, p)
+
+    if len(reduction.pivots) < len(matrix):
+        return 0
+    return reduction.determinant
+
+
+def inverse(matrix: Matrix, p: int) -> Matrix:
+    """
+    The inverse function returns the inverse of a square matrix over Z/pZ.
+    If the inverse doesn't exist, it raises an error.
+
+    :param matrix: Matrix: The square matrix as a list of rows
+    :param p: int: Specify the prime modulus
+    :return: The inverse of the matrix
+
+    """
+
+    k = len(matrix)
+    if any(len(row) != k for row in matrix):
+        raise ValueError('The matrix must be square')
+
+    augmented = [row + [int(i == j) for j in range(k)]
+                 for i, row in enumerate(matrix)]
+    reduction = _row_reduce(augmented, p)
+
+    if reduction.pivots[:k] != list(range(k)):
+        raise ValueError("The inverse of the matrix doesn't exist")
+
+    return [row[k:] for row in reduction.matrix]
+
+
+def _kernel_from_reduction(R: Matrix, pivots: List[int], cols: int, n: int) -> Matrix:
+    pivots = [c for c in pivots if c < cols]
+    basis = list()
+
+    for f in range(cols):
+        if f in pivots:
+            continue
+
+        v = [0] * cols
+        v[f] = 1
+        for i, c in enumerate(pivots):
+            v[c] = -R[i][f] % n
+        basis.append(v)
+
+    return basis
+
+
+def kernel(matrix: Matrix, p: int) -> Matrix:
+    """
+    The kernel function returns a basis of the null space of a matrix over Z/pZ,
+    that is, of the vectors x such that matrix*x = 0 (mod p).
+
+    :param matrix: Matrix: The matrix as a list of rows
+    :param p: int: Specify the prime modulus
+    :return: A list of basis vectors of the kernel
+
+    """
+
+    reduction = _row_reduce(matrix, p)
+    cols = len(matrix[0]) if matrix else 0
+
+    return _kernel_from_reduction(reduction.matrix, reduction.pivots, cols, p)
+
+# Normal Forms
+
+
+def hermite_normal_form(matrix: Matrix, n: int) -> Matrix:
+    """
+    The hermite_normal_form function returns the Hermite normal form of the row
+    module of a matrix over Z/nZ, that is, the upper triangular HNF of the lattice
+    spanned by the rows of the matrix together with n*Z^k. The result is a k x k
+    matrix whose diagonal entries divide n and whose entries above each diagonal
+    entry are smaller than it. Rows whose diagonal entry is n are zero mod n.
+
+    :param matrix: Matrix: The matrix as a list of rows
+    :param n: int: Specify the modulus
+    :return: The Hermite normal form as a k x k matrix
+
+    """
+
+    k = len(matrix[0]) if matrix else 0
+    rows = [[x % n for x in row] for row in matrix]
+    H = list()
+
+    for j in range(k):
+        p = [0] * k
+        p[j] = n
+
+        for r in rows:
+            c = r[j]
+            if not c:
+                continue
+
+            a = p[j]
+            if c % a == 0:
+                q = c // a
+                r[:] = [(x - q*y) % n for x, y in zip(r, p)]
+                continue
+
+            aee = elegant_eea(a, c)
+            g = aee.d
+            new_p = [aee.alpha*x + aee.beta*y for x, y in zip(p, r)]
+            r[:] = [((a//g)*y - (c//g)*x) % n for x, y in zip(p, r)]
+            p = [x % n for x in new_p[:j]] + [g] + [x % n for x in new_p[j+1:]]
+
+        # (n/g)*p - n*e_j also lies in the module and must be kept
+        extra = [(n // p[j]) * x % n for x in p]
+        extra[j] = 0
+        rows = [r for r in rows if any(r)]
+        if any(extra):
+            rows.append(extra)
+
+        H.append(p)
+
+    for j in range(k):
+        d = H[j][j]
+        for i in range(j):
+            q = H[i][j] // d
+            if q:
+                H[i] = [x - q*y for x, y in zip(H[i], H[j])]
+
+    return H
+
+
+def _diagonalize(M: Matrix, n: int, b: Optional[List[int]] = None) -> Tuple[Matrix, List[int], Matrix]:
+    rows, cols = len(M), len(M[0])
+    V = [[int(i == j) for j in range(cols)] for i in range(cols)]
+    b = list(b) if b is not None else [0] * rows
+
+    for t in range(min(rows, cols)):
+        entry = next(((i, j) for i in range(t, rows)
+                      for j in range(t, cols) if M[i][j]), None)
+        if entry is None:
+            break
+
+        i, j = entry
+        M[t], M[i] = M[i], M[t]
+        b[t], b[i] = b[i], b[t]
+        for row in M:
+            row[t], row[j] = row[j], row[t]
+        for row in V:
+            row[t], row[j] = row[j], row[t]
+
+        done = False
+        while not done:
+            done = True
+
+            for i in range(t+1, rows):
+                a, c = M[t][t], M[i][t]
+                if not c:
+                    continue
+
+                if c % a == 0:
+                    q = c // a
+                    M[i] = [(x - q*y) % n for x, y in zip(M[i], M[t])]
+                    b[i] = (b[i] - q*b[t]) % n
+                else:
+                    aee = elegant_eea(a, c)
+                    g, s, u = aee
+                    M[t], M[i] = ([(s*x + u*y) % n for x, y in zip(M[t], M[i])],
+                                  [((a//g)*y - (c//g)*x) % n for x, y in zip(M[t], M[i])])
+                    b[t], b[i] = (s*b[t] + u*b[i]) % n, ((a//g)*b[i] - (c//g)*b[t]) % n
+
+            for j in range(t+1, cols):
+                a, c = M[t][t], M[t][j]
+                if not c:
+                    continue
+
+                done = False
+                if c % a == 0:
+                    q = c // a
+                    for row in M:
+                        row[j] = (row[j] - q*row[t]) % n
+                    for row in V:
+                        row[j] = (row[j] - q*row[t]) % n
+                else:
+                    aee = elegant_eea(a, c)
+                    g, s, u = aee
+                    for row in M + V:
+                        x, y = row[t], row[j]
+                        row[t], row[j] = (s*x + u*y) % n, ((a//g)*y - (c//g)*x) % n
+
+    return M, b, V
+
+
+def smith_normal_form(matrix: Matrix, n: int) -> List[int]:
+    """
+    The smith_normal_form function returns the invariant factors of a matrix over
+    Z/nZ: the diagonal d_1 | d_2 | ... of its Smith normal form, each one a divisor
+    of n. Zero entries of the diagonal are returned as 0.
+
+    :param matrix: Matrix: The matrix as a list of rows
+    :param n: int: Specify the modulus
+    :return: The list of the min(rows, cols) invariant factors
+
+    """
+
+    if not matrix or not matrix[0]:
+        return []
+
+    M = [[x % n for x in row] for row in matrix]
+    M, _, _ = _diagonalize(M, n)
+    diagonal = [gcd(M[i][i], n) for i in range(min(len(M), len(M[0])))]
+
+    for i in range(len(diagonal)):
+        for j in range(i+1, len(diagonal)):
+            a, c = diagonal[i], diagonal[j]
+            g = gcd(a, c)
+            diagonal[i], diagonal[j] = g, a*c // g
+
+    return [d % n for d in diagonal]
+
+# Linear Congruence Systems
+
+
+def _solve_smith(matrix: Matrix, vector: List[int], n: int) -> LinearSolution:
+    rows, cols = len(matrix), len(matrix[0])
+    M = [[x % n for x in row] for row in matrix]
+    M, c, V = _diagonalize(M, n, [x % n for x in vector])
+
+    y = [0] * cols
+    generators = list()
+
+    for i in range(rows):
+        d = M[i][i] if i < cols else 0
+        g = gcd(d, n)
+
+        if c[i] % g:
+            raise ValueError('The system has no solution')
+
+        if i < cols and d:
+            y[i] = (c[i] // g) * _inverse(d // g, n // g) % (n // g)
+
+    for j in range(cols):
+        d = M[j][j] if j < rows else 0
+        step = n // gcd(d, n)
+        if step < n:
+            generators.append([row[j] * step % n for row in V])
+
+    particular = [sum(v*w for v, w in zip(row, y)) % n for row in V]
+
+    return LinearSolution(particular, generators, n)
+
+
+def solve_linear_system(matrix: Matrix, vector: List[int], n: int) -> LinearSolution:
+    """
+    The solve_linear_system function solves the system of linear congruences
+    matrix*x = vector (mod n). The system is row reduced while every pivot is
+    invertible mod n, which is always the case for prime n; otherwise it is
+    diagonalized as in the Smith normal form.
+    If the system doesn't have a solution, it raises an error.
+
+    :param matrix: Matrix: The coefficients of the system as a list of rows
+    :param vector: List[int]: The right hand side of the system
+    :param n: int: Specify the modulus
+    :return: A LinearSolution with a particular solution and generators of the kernel,
+        so that every solution is the particular one plus a combination of them
+
+    """
+
+    if len(matrix) != len(vector):
+        raise ValueError('matrix and vector must have the same number of rows')
+
+    cols = len(matrix[0])
+    augmented = [row + [b] for row, b in zip(matrix, vector)]
+
+    try:
+        reduction = _row_reduce(augmented, n)
+    except ValueError:
+        return _solve_smith(matrix, vector, n)
+
+    if cols in reduction.pivots:
+        raise ValueError('The system has no solution')
+
+    particular = [0] * cols
+    for i, c in enumerate(reduction.pivots):
+        particular[c] = reduction.matrix[i][cols]
+
+    generators = _kernel_from_reduction(reduction.matrix, reduction.pivots, cols, n)
+
+    return LinearSolution(particular, generators, n)
@@ -0,0 +1,155 @@
+from typing import Union
+
+'''A ModRing is created once per modulus n and hands out ModElement objects, residues
+    in [0, n) with overloaded arithmetic. Products are reduced with a single % n and
+    powers with the built-in three argument pow: in CPython, Montgomery and Barrett
+    reductions written in Python are slower than % n at every size measured (64 to
+    2048 bits), so the ring doesn't use them.'''
+
+# Ring
+
+
+class ModRing:
+    __slots__ = ('n',)
+
+    def __init__(self, n: int) -> None:
+        if n < 1:
+            raise ValueError('n must be positive')
+
+        self.n = n
+
+    def __call__(self, value: Union['ModElement', int]) -> 'ModElement':
+        """
+        The __call__ function maps an integer into the ring, returning its ModElement.
+
+        :param value: int: Any int
+        :return: The ModElement representing value mod n
+
+        """
+
+        if isinstance(value, ModElement):
+            if value.ring.n != self.n:
+                raise ValueError('Elements belong to different rings')
+            return value
+
+        return ModElement(self, value % self.n)
+
+    def __repr__(self) -> str:
+        return f'ModRing({self.n})'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ModRing) and other.n == self.n
+
+    def __hash__(self) -> int:
+        return hash(self.n)
+
+    def exp(self, b: int, e: int) -> int:
+        """
+        The exp function returns b^e (mod n) as an int.
+
+        :param b: int: Represent the base of the modular power
+        :param e: int: Specify the exponent
+        :return: The result of b^e mod n
+
+        """
+
+        return pow(b, e, self.n)
+
+# Elements
+
+
+class ModElement:
+    __slots__ = ('ring', 'value')
+
+    def __init__(self, ring: ModRing, value: int) -> None:
+        self.ring = ring
+        self.value = value
+
+    def _operand(self, other: Union['ModElement', int]) -> int:
+        if isinstance(other, ModElement):
+            if other.ring.n != self.ring.n:
+                raise ValueError('Elements belong to different rings')
+            return other.value
+        if isinstance(other, int):
+            return other
+        return NotImplemented
+
+    def __int__(self) -> int:
+        return self.value
+
+    __index__ = __int__
+
+    def __repr__(self) -> str:
+        return f'ModElement({self.value}, {self.ring.n})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModElement):
+            return NotImplemented
+        return other.ring.n == self.ring.n and other.value == self.value
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.ring.n))
+
+    def __add__(self, other: Union['ModElement', int]) -> 'ModElement':
+        ring = self.ring
+        if type(other) is ModElement and other.ring is ring:
+            return ModElement(ring, (self.value + other.value) % ring.n)
+
+        b = self._operand(other)
+        if b is NotImplemented:
+            return b
+
+        return ModElement(ring, (self.value + b) % ring.n)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union['ModElement', int]) -> 'ModElement':
+        b = self._operand(other)
+        if b is NotImplemented:
+            return b
+
+        return ModElement(self.ring, (self.value - b) % self.ring.n)
+
+    def __rsub__(self, other: int) -> 'ModElement':
+        return ModElement(self.ring, (other - self.value) % self.ring.n)
+
+    def __neg__(self) -> 'ModElement':
+        return ModElement(self.ring, -self.value % self.ring.n)
+
+    def __mul__(self, other: Union['ModElement', int]) -> 'ModElement':
+        ring = self.ring
+        if type(other) is ModElement and other.ring is ring:
+            return ModElement(ring, self.value * other.value % ring.n)
+
+        b = self._operand(other)
+        if b is NotImplemented:
+            return b
+
+        return ModElement(ring, self.value * b % ring.n)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, e: int) -> 'ModElement':
+        if e < 0:
+            return self.inverse() ** -e
+
+        return ModElement(self.ring, pow(self.value, e, self.ring.n))
+
+    def inverse(self) -> 'ModElement':
+        """
+        The inverse function returns the multiplicative inverse of the element.
+        If the inverse doesn't exist, it raises an error.
+
+        :return: The inverse of the element in Zn
+
+        """
+
+        try:
+            inv = pow(self.value, -1, self.ring.n)
+        except ValueError:
+            raise ValueError("The inverse of a in Zn doesn't exist")
+
+        return ModElement(self.ring, inv)
+
+    def __truediv__(self, other: Union['ModElement', int]) -> 'ModElement':
+        return self * self.ring(other).inverse()
@@ -0,0 +1,60 @@
+import json
+from benchmarks.__main__ import main
+from benchmarks.cases import CASES
+from benchmarks.harness import *
+
+
+def measurement(case, size, seconds, peak_bytes):
+    return Measurement(case, size, seconds, peak_bytes, None, None)
+
+# Cases
+
+
+def test_cases_setup():
+    for case in CASES:
+        args = case.setup(case.sizes[0])
+        case.func(*args)
+        if case.baseline is not None:
+            case.baseline[1](*args)
+
+# Compare
+
+
+def test_compare():
+    old = [measurement('a', 1, 1.0, 100), measurement('a', 2, 1.0, 100),
+           measurement('b', 1, 1.0, 100)]
+    new = [measurement('a', 1, 1.2, 100), measurement('a', 2, 1.5, 100),
+           measurement('b', 1, 1.0, 200), measurement('c', 1, 9.0, 900)]
+
+    assert compare(old, new, 0.25) == [Regression('a', 2, 'seconds', 1.0, 1.5)]
+    assert compare(old, new, 0.25, {}) == [Regression('a', 2, 'seconds', 1.0, 1.5),
+                                           Regression('b', 1, 'peak_bytes', 100, 200)]
+
+
+def test_compare_floors():
+    old = [measurement('a', 1, 2e-7, 0), measurement('b', 1, 1e-3, 0)]
+    new = [measurement('a', 1, 6e-7, 32), measurement('b', 1, 1e-3, 4096)]
+
+    assert compare(old, new) == [Regression('b', 1, 'peak_bytes', 0, 4096)]
+
+# Command Line
+
+
+def test_run_and_compare(tmp_path):
+    output = str(tmp_path / 'results.json')
+    assert main(['run', '-k', 'mod_exponentiation', '--quick', '--repeat', '1', '-o', output]) == 0
+
+    results = load(output)
+    assert [(m.case, m.size) for m in results] == [('mod_exponentiation', 64), ('mod_exponentiation', 256)]
+    assert results[0].baseline == 'pow'
+
+    assert main(['compare', output, output]) == 0
+
+    slower = str(tmp_path / 'slower.json')
+    with open(output) as f:
+        data = json.load(f)
+    data['results'][0]['seconds'] += 1.0
+    with open(slower, 'w') as f:
+        json.dump(data, f)
+
+    assert main(['compare', output, slower]) == 1
@@ -0,0 +1,140 @@
+import pytest
+import threading
+import src.cache as cache
+from src.cache import LRUCache, memoize
+from src.integer_arith import divp_factorization, fermat_primality, totient
+
+
+@pytest.fixture
+def enabled():
+    cache.configure()
+    cache.enable()
+    yield
+    cache.disable()
+    cache.configure()
+
+# LRU
+
+
+def test_lru_eviction():
+    lru = LRUCache(maxsize=2)
+    lru.put('a', 1, 1)
+    lru.put('b', 2, 1)
+    lru.get('a')
+    lru.put('c', 3, 1)
+    assert 'a' in lru and 'c' in lru and 'b' not in lru
+
+
+def test_lru_bytes():
+    lru = LRUCache(maxsize=None, maxbytes=10)
+    lru.put('a', 1, 6)
+    lru.put('b', 2, 6)
+    assert 'a' not in lru and lru.bytes == 6
+    lru.put('c', 3, 11)
+    assert 'c' not in lru
+
+# Memoization
+
+
+def test_disabled_by_default():
+    assert not cache.is_enabled('divp_factorization')
+    divp_factorization(123456)
+    assert cache.stats('divp_factorization').misses == 0
+
+
+def test_divp_factorization_cached(enabled, benchmark):
+    divp_factorization(123456)
+    res = benchmark(divp_factorization, 123456)
+    assert res == {2: 6, 3: 1, 643: 1}.items()
+    assert cache.stats('divp_factorization').misses == 1
+
+
+def test_fermat_probable_prime_not_cached(enabled):
+    assert fermat_primality(46061) == True
+    assert fermat_primality(46061) == True
+    assert fermat_primality(972) == False
+    assert fermat_primality(972) == False
+
+    stats = cache.stats('fermat_primality')
+    assert (stats.hits, stats.misses) == (1, 3)
+
+
+def test_totient_of_probable_prime_not_cached(enabled):
+    assert totient(46061) == 46060
+    assert totient(972) == 324
+    assert totient(972) == 324
+    assert cache.stats('totient').hits == 1
+    assert cache.stats('totient').misses == 2
+
+
+def test_disable_one_function(enabled):
+    cache.disable('totient')
+    totient(972)
+    totient(972)
+    assert cache.stats('totient').misses == 0
+    assert cache.stats('fermat_primality').hits == 1
+
+
+def test_enable_unknown_function():
+    with pytest.raises(ValueError):
+        cache.enable('sieve')
+
+
+def test_disk_store(enabled, tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache.configure(path=path)
+    divp_factorization(123456)
+
+    # Restart: a new in-memory cache over the same file
+    cache.configure(path=path)
+    res = divp_factorization(123456)
+
+    assert res == {2: 6, 3: 1, 643: 1}.items()
+    assert cache.stats('divp_factorization').disk_hits == 1
+
+
+def test_keyword_arguments(enabled):
+    assert totient(n=972) == 324
+    assert totient(972) == 324
+    assert fermat_primality(972, confidence=5) == False
+    assert cache.stats('totient').hits == 1
+
+
+def test_version_in_key(enabled, tmp_path):
+    cache.configure(path=str(tmp_path / 'cache.sqlite'))
+
+    @memoize()
+    def versioned(n):
+        return n
+
+    cache.enable('versioned')
+    versioned(5)
+
+    @memoize(version=2)
+    def versioned(n):
+        return 2*n
+
+    cache.enable('versioned')
+    assert versioned(5) == 10
+    assert cache.stats('versioned').disk_hits == 0
+
+
+def test_disk_store_threads(enabled, tmp_path):
+    cache.configure(path=str(tmp_path / 'cache.sqlite'))
+    errors = list()
+
+    def work(start):
+        try:
+            for n in range(start, start + 50):
+                totient(n)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(2 + 25*i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert totient(972) == 324
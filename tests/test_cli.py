@@ -0,0 +1,108 @@
+import json
+import pytest
+from src.cli import main, process
+
+
+def read_jsonl(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+# Process
+
+
+def test_process_in_order(benchmark):
+    lines = [str(n) for n in range(2, 200)]
+    res = benchmark(lambda: list(process('factor', {}, lines, jobs=2, chunksize=7, max_chunks=2)))
+
+    assert [r['input'] for r in res] == lines
+    assert res[96 - 2]['result'] == [[2, 5], [3, 1]]
+    assert res[121 - 2]['result'] == [[11, 2]]
+    assert res[187 - 2]['result'] == [[11, 1], [17, 1]]
+
+
+def test_process_known_factorizations():
+    lines = ['35', '221', str(44021*3)]
+
+    factors = list(process('factor', {}, lines))
+    assert [r['result'] for r in factors] == [[[5, 1], [7, 1]], [[13, 1], [17, 1]], [[3, 1], [44021, 1]]]
+
+    totients = list(process('totient', {}, lines))
+    assert [r['result'] for r in totients] == [24, 192, 88040]
+
+
+def test_process_timeout():
+    options = {'timeout': 0.2}
+    res = list(process('totient', options, ['972', '73448480092567094497', '46061']))
+
+    assert res[0]['result'] == 324
+    assert res[1]['error'] == 'timeout'
+    assert res[2]['result'] == 46060
+
+
+def test_process_small_and_bad_inputs():
+    res = list(process('is_prime', {'confidence': 10}, ['1', '2', '3', '4']))
+    assert [r['result'] for r in res] == [False, True, True, False]
+
+    res = list(process('crt', {}, ['5 1; 2 3', '1 -7', '1 0']))
+    assert res[0]['result'] == {'mod': 3, 'remainder': 2}
+    assert res[1]['error'] == 'mod must be positive'
+    assert res[2]['error'] == 'mod must be positive'
+
+    for operation in ('factor', 'totient'):
+        res = list(process(operation, {}, ['0', '-12']))
+        assert [r['error'] for r in res] == ['n must be positive'] * 2
+
+
+def test_process_chunksize():
+    with pytest.raises(ValueError):
+        list(process('factor', {}, ['12'], chunksize=0))
+
+
+def test_process_errors():
+    res = list(process('inverse', {}, ['3 10', '2 4', '7']))
+
+    assert res[0]['result'] == 7
+    assert res[1]['error'] == "The inverse of a in Zn doesn't exist"
+    assert 'error' in res[2]
+
+# Command Line
+
+
+def test_main_crt(tmp_path, capsys):
+    path = tmp_path / 'systems.txt'
+    path.write_text('# x = 22 (2), x = 7 (3), x = 160 (5)\n22 2; 7 3; 160 5\n\n2 5 3; 1 1 4\n')
+
+    assert main(['crt', str(path), '-j', '1']) == 0
+
+    out, err = capsys.readouterr()
+    assert read_jsonl(out) == [
+        {'input': '22 2; 7 3; 160 5', 'result': {'mod': 30, 'remainder': 10}},
+        {'input': '2 5 3; 1 1 4', 'result': {'mod': 12, 'remainder': 1}},
+    ]
+    assert '2 items (0 errors, 0 timeouts)' in err
+
+
+def test_main_term(tmp_path):
+    source = tmp_path / 'n.txt'
+    output = tmp_path / 'out.jsonl'
+    source.write_text('7\n')
+
+    main(['term', str(source), '-o', str(output), '-q', '-j', '1',
+          '--coefficients', '1', '1', '1', '--cases', '0:0', '1:1'])
+
+    assert read_jsonl(output.read_text())[0]['result'] == pytest.approx(13)
+
+
+def test_main_is_prime_stdin(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', __import__('io').StringIO('46061\n972\n'))
+
+    main(['is_prime', '-q', '-j', '2'])
+
+    out, _ = capsys.readouterr()
+    assert [r['result'] for r in read_jsonl(out)] == [True, False]
+
+
+@pytest.mark.parametrize('option', ['--chunksize', '--jobs'])
+@pytest.mark.parametrize('value', ['0', '-1'])
+def test_main_positive_options(option, value):
+    with pytest.raises(SystemExit):
+        main(['factor', '-q', option, value])
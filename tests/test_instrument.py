@@ -0,0 +1,91 @@
+import json
+import src.instrument as instrument
+import src.integer_arith as integer_arith
+import src.modular_arith as modular_arith
+from src.instrument import collect
+from src.integer_arith import mod_exponentiation
+
+
+def test_disabled_by_default():
+    instrument.reset()
+    integer_arith.totient(972)
+    assert instrument.snapshot() == {'functions': {}, 'counters': {}}
+
+
+def test_collect_totient():
+    with collect() as recorder:
+        integer_arith.totient(972)
+
+    data = recorder.snapshot()
+    assert data['functions']['totient']['calls'] == 1
+    assert data['functions']['totient']['bits'] == {10: 1}
+    assert data['functions']['fermat_primality']['calls'] == 1
+    assert data['functions']['divp_algorithm']['calls'] == 7
+    assert data['counters']['fermat_primality.rounds'] == 1
+    assert not instrument.enabled
+
+
+def test_keyword_arguments():
+    with collect() as recorder:
+        integer_arith.totient(n=972)
+
+    assert recorder.snapshot()['functions']['totient']['bits'] == {10: 1}
+
+
+def test_counters():
+    with collect() as recorder:
+        integer_arith.fermat_primality(46061, 10)
+        integer_arith.divp_algorithm(44021)
+        integer_arith.divp_algorithm(7*11)
+        integer_arith.divp_algorithm(3)
+        integer_arith.elegant_eea(1492, 1066)
+        modular_arith.inverse_igneous(12123, 5)
+        integer_arith.mod_exponentiation(3, 13, 7)
+
+    counters = recorder.snapshot()['counters']
+    assert counters['fermat_primality.rounds'] == 10
+    assert counters['divp_algorithm.trial_divisions'] == (2 + 2*35) + (2 + 2*1) + 2
+    assert counters['elegant_eea.steps'] == 5
+    assert counters['inverse_igneous.candidates'] == 3
+    assert counters['mod_exponentiation.squarings'] == 10*15 + 3
+
+
+def test_rsa_check():
+    bob = modular_arith.RSAKey(7369362041, 5460505879, 21117089390589805177)
+
+    with collect() as recorder:
+        bob.check()
+
+    functions = recorder.snapshot()['functions']
+    assert functions['fermat_primality']['calls'] == 2
+    assert functions['mod_exponentiation']['calls'] == 200
+    assert functions['mod_exponentiation']['seconds'] <= functions['fermat_primality']['seconds']
+
+
+def test_enable_and_json():
+    instrument.reset()
+    instrument.enable()
+    try:
+        integer_arith.elegant_eea(31, 17)
+    finally:
+        instrument.disable()
+
+    data = json.loads(instrument.to_json())
+    assert data['functions']['elegant_eea']['calls'] == 1
+    assert data['functions']['elegant_eea']['bits'] == {'5': 1}
+    instrument.reset()
+
+
+def test_only_toolkit_modules_patched():
+    plain = integer_arith.mod_exponentiation
+    assert not hasattr(plain, '__wrapped__')
+
+    with collect() as recorder:
+        assert integer_arith.mod_exponentiation is not plain
+        assert modular_arith.mod_exponentiation is integer_arith.mod_exponentiation
+        assert mod_exponentiation is plain
+        mod_exponentiation(3, 13, 7)
+
+    assert recorder.snapshot()['functions'] == {}
+    assert integer_arith.mod_exponentiation is plain
+    assert modular_arith.mod_exponentiation is plain
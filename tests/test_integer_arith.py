@@ -38,6 +38,10 @@ def test_fermat_primality(benchmark):
     assert res == True
 
 
+def test_fermat_primality_small():
+    assert [fermat_primality(n) for n in range(-1, 6)] == [False, False, False, True, True, False, True]
+
+
 # Factorization
 
 
@@ -71,6 +75,25 @@ def test_divp_algorithm(benchmark):
     res = benchmark(divp_algorithm, 44021)
     assert res == 44021
 
+
+def test_divp_algorithm_composite():
+    assert divp_algorithm(35) == 5
+    assert divp_algorithm(221) == 13
+    assert divp_algorithm(49) == 7
+    assert divp_algorithm(13*13*17) == 13
+
+
+def test_divp_factorization_large_factors():
+    assert dict(divp_factorization(221)) == {13: 1, 17: 1}
+    assert dict(divp_factorization(44021*3)) == {3: 1, 44021: 1}
+    assert dict(divp_factorization(2027651281)) == {44021: 1, 46061: 1}
+
+
+def test_totient_large_factors():
+    assert totient(35) == 24
+    assert totient(221) == 192
+    assert totient(44021*3) == 88040
+
 # Euclid
 
 
@@ -57,7 +57,21 @@ def test_normalize_equation(benchmark):
     assert normalized == CongruenceEquation(1, 1, 3)
 
 
+def test_normalize_equation_mod():
+    assert normalize_equation(CongruenceEquation(-4, 5, 7)) == CongruenceEquation(1, 4, 7)
+    assert normalize_equation(CongruenceEquation(3, 5, 1)) == CongruenceEquation(1, 0, 1)
+    with pytest.raises(ValueError):
+        normalize_equation(CongruenceEquation(1, 5, -7))
+
+
 def test_CRT_solve_special_case(benchmark):
 
     solution = benchmark(CRT_solve_special_case, special_case)
     assert solution == CRTSolution(30, 10)
+
+
+def test_CRT_solve_special_case_ring():
+    ring = ModRing(30)
+    assert CRT_solve_special_case(special_case, ring) == CRTSolution(30, 10)
+    with pytest.raises(ValueError):
+        CRT_solve_special_case(special_case, ModRing(31))
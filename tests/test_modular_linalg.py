@@ -0,0 +1,136 @@
+import pytest
+import random
+from itertools import product
+import src.modular_linalg as linalg
+from src.modular_linalg import *
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(linalg, 'np', None)
+    return request.param
+
+
+def mat_vec(matrix, x, n):
+    return [sum(a*b for a, b in zip(row, x)) % n for row in matrix]
+
+
+def mat_mul(A, B, n):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B))) % n
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+A = [[2, 3, 1],
+     [4, 1, 5],
+     [6, 4, 13]]
+
+# Row Reduction
+
+
+def test_row_reduce(backend, benchmark):
+    res = benchmark(row_reduce, A, 7)
+    assert res == [[1, 0, 0], [0, 1, 5], [0, 0, 0]]
+
+
+def test_rank(backend):
+    assert rank(A, 7) == 2
+    assert rank(A, 11) == 3
+
+
+def test_determinant(backend, benchmark):
+    res = benchmark(determinant, A, 11)
+    assert res == (2*(13-20) - 3*(52-30) + 1*(16-6)) % 11
+    assert determinant(A, 7) == 0
+
+
+def test_inverse(backend, benchmark):
+    res = benchmark(inverse, A, 11)
+    assert mat_mul(A, res, 11) == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+
+
+def test_inverse_doesnt_exist(backend):
+    with pytest.raises(ValueError):
+        inverse(A, 7)
+
+
+def test_kernel(backend):
+    basis = kernel(A, 7)
+    assert len(basis) == 1
+    assert mat_vec(A, basis[0], 7) == [0, 0, 0]
+
+
+def test_large_prime_system(backend, benchmark):
+    rng = random.Random(0)
+    p = 1000003
+    M = [[rng.randrange(p) for _ in range(60)] for _ in range(60)]
+    x = [rng.randrange(p) for _ in range(60)]
+    b = mat_vec(M, x, p)
+
+    res = benchmark(solve_linear_system, M, b, p)
+    assert mat_vec(M, res.particular, p) == b
+
+
+def test_big_prime(backend):
+    p = 2**61 - 1
+    M = [[3, 2**60], [5, 7]]
+    assert mat_mul(M, inverse(M, p), p) == [[1, 0], [0, 1]]
+
+# Normal Forms
+
+
+def test_hermite_normal_form(benchmark):
+    res = benchmark(hermite_normal_form, [[2, 4], [3, 3]], 12)
+    assert res == [[1, 5], [0, 6]]
+
+
+def test_hermite_normal_form_annihilator():
+    # 6*(2, 1) = (0, 6) must appear in the module
+    assert hermite_normal_form([[2, 1]], 12) == [[2, 1], [0, 6]]
+
+
+def test_smith_normal_form(benchmark):
+    res = benchmark(smith_normal_form, [[2, 4, 4], [-6, 6, 12], [10, -4, -16]], 1000)
+    assert res == [2, 2, 4]
+
+
+def test_smith_normal_form_zero():
+    assert smith_normal_form([[6, 0], [0, 4]], 12) == [2, 0]
+
+# Linear Congruence Systems
+
+
+def all_solutions(matrix, vector, n):
+    cols = len(matrix[0])
+    return {x for x in product(range(n), repeat=cols)
+            if mat_vec(matrix, x, n) == [b % n for b in vector]}
+
+
+def span(solution):
+    n = solution.mod
+    res = {tuple(solution.particular)}
+    for g in solution.kernel:
+        res |= {tuple((x + k*y) % n for x, y in zip(v, g))
+                for v in res for k in range(n)}
+    return res
+
+
+@pytest.mark.parametrize('matrix, vector, n', [
+    ([[2, 3], [4, 1]], [1, 2], 7),
+    ([[2, 3], [4, 1]], [5, 5], 12),
+    ([[2, 4], [6, 0]], [2, 6], 12),
+    ([[4, 6, 2]], [2], 8),
+    ([[3, 0], [0, 0], [1, 1]], [3, 0, 2], 9),
+])
+def test_solve_linear_system(matrix, vector, n):
+    solution = solve_linear_system(matrix, vector, n)
+    assert span(solution) == all_solutions(matrix, vector, n)
+
+
+def test_solve_linear_system_no_solution():
+    with pytest.raises(ValueError):
+        solve_linear_system([[2, 4], [1, 2]], [1, 0], 6)
+    with pytest.raises(ValueError):
+        solve_linear_system([[1, 1], [1, 1]], [1, 2], 5)
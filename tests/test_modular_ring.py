@@ -0,0 +1,89 @@
+import pytest
+from src.modular_ring import *
+from src.integer_arith import mod_exponentiation
+
+# Ring
+
+odd = ModRing(34567891)
+even = ModRing(34567890)
+
+
+def test_exp_odd(benchmark):
+    res = benchmark(odd.exp, 12345678, 23456789)
+    assert res == pow(12345678, 23456789, 34567891)
+
+
+def test_exp_even(benchmark):
+    res = benchmark(even.exp, 12345678, 23456789)
+    assert res == 32654808
+
+
+def test_mod_exponentiation_ring(benchmark):
+    res = benchmark(mod_exponentiation,
+                    12345678,
+                    23456789,
+                    34567890,
+                    even)
+    assert res == 32654808
+
+
+def test_mod_exponentiation_wrong_ring():
+    with pytest.raises(ValueError):
+        mod_exponentiation(2, 3, 34567890, odd)
+
+# Elements
+
+
+@pytest.mark.parametrize('ring', [odd, even, ModRing(1), ModRing(2)])
+def test_element_operations(ring):
+    n = ring.n
+    for a, b in [(0, 0), (1, n-1), (12345, 67890), (-5, 7)]:
+        x, y = ring(a), ring(b)
+        assert int(x + y) == (a+b) % n
+        assert int(x - y) == (a-b) % n
+        assert int(y - x) == (b-a) % n
+        assert int(x * y) == (a*b) % n
+        assert int(-x) == (-a) % n
+        assert int(x ** 7) == pow(a, 7, n)
+        assert int(3 - x) == (3-a) % n
+        assert int(2 * x + 1) == (2*a+1) % n
+
+
+def test_element_inverse(benchmark):
+    inv = benchmark(odd(12345678).inverse)
+    assert int(inv * 12345678) == 1
+    assert odd(12345678) ** -1 == inv
+
+
+def test_element_inverse_doesnt_exist():
+    with pytest.raises(ValueError):
+        even(6).inverse()
+
+
+def test_element_different_rings():
+    with pytest.raises(ValueError):
+        odd(1) + even(1)
+
+
+def test_element_slots():
+    with pytest.raises(AttributeError):
+        odd(1).other = 1
+
+
+def test_element_hash_eq():
+    assert odd(5) == ModRing(34567891)(5)
+    assert odd(5) != 5
+    assert len({odd(5), ModRing(34567891)(5), 5}) == 2
+
+# RSA
+
+
+def test_rsa_ring_opt_in():
+    from src.modular_arith import RSAKey, RSAMessage
+
+    assert RSAKey(61, 53, 17).ring is None
+
+    key = RSAKey(61, 53, 17, use_ring=True)
+    encrypted = RSAMessage(65).encrypt(key)
+    assert encrypted == pow(65, 17, key.n)
+    assert RSAMessage(encrypted).decrypt(key.private_key(), key.n, key.ring) == 65